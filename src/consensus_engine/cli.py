@@ -6,32 +6,41 @@ import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from .engine import ConsensusEngine
 from .models.openai import OpenAILLM
 from .models.anthropic import AnthropicLLM
-from .database.models import Base, Discussion
+from .database.models import Discussion
 from .config.settings import LOG_LEVEL_NUM
 from .config.round_config import ROUND_SEQUENCE
-from .web import GradioInterface, find_available_port
+from .web import GradioInterface, find_available_port, _get_engine
 import logging
 from typing import Dict
 
 logging.basicConfig(level=LOG_LEVEL_NUM)
 logger = logging.getLogger(__name__)
-console = Console()
+
+_CONSOLE = None
+
+def _get_console() -> Console:
+    """Return the process-wide Rich console, creating it on first use.
+
+    Console() probes terminal capabilities (isatty, env vars) at
+    construction; building it lazily keeps that off the import path for
+    callers that never print, same pattern as web._get_theme().
+    """
+    global _CONSOLE
+    if _CONSOLE is None:
+        _CONSOLE = Console()
+    return _CONSOLE
 
 def get_db_session():
     """Initialize and return a database session."""
-    database_url = os.getenv("CONSENSUS_ENGINE_DB_URL", "sqlite:///consensus_engine.db")
-    engine = create_engine(database_url)
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    return Session()
+    return sessionmaker(bind=_get_engine())()
 
 def list_discussions(db_session):
     """List all discussions from the database."""
+    console = _get_console()
     discussions = db_session.query(Discussion).all()
     
     table = Table(show_header=True, header_style="bold magenta")
@@ -75,6 +84,7 @@ def get_format_sections(round_format: str) -> Dict[str, str]:
 @click.option('--load', type=int, help='Load a previous discussion by ID and continue')
 def main(web, cli, port, host, list_mode, view, debug, file, load):
     """Consensus Engine - Orchestrate discussions between multiple LLMs."""
+    console = _get_console()
     if debug:
         os.environ["CONSENSUS_ENGINE_LOG_LEVEL"] = "DEBUG"
 
@@ -224,6 +234,8 @@ def main(web, cli, port, host, list_mode, view, debug, file, load):
 
 async def run_discussion(prompt: str, engine: ConsensusEngine) -> dict:
     """Run a discussion and return the result."""
+    console = _get_console()
+
     def display_progress(msg: str):
         # Check if this is a round summary
         if (msg.strip().startswith('Round') and 
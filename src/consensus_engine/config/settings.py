@@ -1,6 +1,7 @@
 """Configuration settings for the Consensus Engine."""
 import os
 import logging
+from functools import lru_cache
 from typing import Dict, Any
 
 # Model Settings, can add another model by adding a new key to the dictionary
@@ -49,13 +50,22 @@ def get_enabled_models() -> Dict[str, Dict[str, Any]]:
     """Get configurations for all enabled models."""
     return {name: config for name, config in MODEL_CONFIGS.items() if config["enabled"]}
 
+_REQUIRED_MODEL_FIELDS = frozenset({
+    "api_key_env", "model", "temperature", "max_tokens",
+    "module_path", "class_name", "system_prompt"
+})
+
+@lru_cache(maxsize=None)
+def _has_required_fields(fields: frozenset) -> bool:
+    return _REQUIRED_MODEL_FIELDS <= fields
+
 def validate_model_config(config: Dict[str, Any]) -> bool:
-    """Validate that a model configuration has all required fields."""
-    required_fields = [
-        "api_key_env", "model", "temperature", "max_tokens",
-        "module_path", "class_name", "system_prompt"
-    ]
-    return all(field in config for field in required_fields)
+    """Validate that a model configuration has all required fields.
+
+    Memoized on the config's key set, so repeated validation of the
+    module-level MODEL_CONFIGS entries is a single cache lookup.
+    """
+    return _has_required_fields(frozenset(config))
 
 def get_api_key(config: Dict[str, Any]) -> str:
     """Get API key for a model from environment variables."""
@@ -11,7 +11,7 @@ class Discussion(Base):
     
     id = Column(Integer, primary_key=True)
     prompt = Column(Text, nullable=False)
-    started_at = Column(DateTime, default=datetime.datetime.utcnow)
+    started_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
     completed_at = Column(DateTime, nullable=True)
     consensus_reached = Column(Integer, default=0)
     final_consensus = Column(Text, nullable=True)
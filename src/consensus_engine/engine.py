@@ -6,10 +6,12 @@ from datetime import datetime, UTC
 import logging
 import nltk
 import os
+import re
 from nltk.tokenize import sent_tokenize
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from difflib import SequenceMatcher
+from functools import lru_cache
 
 from .models.base import BaseLLM
 from .database.models import Discussion, DiscussionRound, LLMResponse
@@ -18,40 +20,48 @@ from .config.round_config import ROUND_CONFIGS, RESPONSE_FORMAT, ROUND_SEQUENCE
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; _extract_confidence runs per LLM per round.
+# NOTE: Depends on CONFIDENCE section in RESPONSE_FORMAT from round_config.py
+_CONFIDENCE_RE = re.compile(r"CONFIDENCE:\s*(\d*\.?\d+)", re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def _setup_nltk() -> bool:
+    """Set up NLTK resources.
+
+    Downloads and configures required NLTK components for text analysis:
+    - Creates a dedicated directory for NLTK data in project's data folder
+    - Downloads 'punkt' for sentence tokenization if not present
+    - Downloads 'stopwords' for filtering common words if not present
+
+    Memoized at module scope: the resource check hits the filesystem (and
+    possibly the network), so only the first engine per process pays it.
+
+    Returns:
+        bool: True if setup successful, False if any errors occurred
+    """
+    try:
+        # Create data directory within project instead of home folder
+        nltk_data_dir = os.path.join(os.path.dirname(__file__), "..", "data", "nltk_data")
+        os.makedirs(nltk_data_dir, exist_ok=True)
+
+        for resource in ['punkt', 'stopwords']:
+            try:
+                nltk.data.find(f'tokenizers/{resource}')
+            except LookupError:
+                nltk.download(resource, quiet=True, download_dir=nltk_data_dir)
+
+        return True
+    except Exception as e:
+        logger.warning(f"NLTK setup failed: {e}")
+        return False
+
 class ConsensusEngine:
     def __init__(self, llms: List[BaseLLM], db_session: Session):
         self.llms = llms
         self.db = db_session
-        self.nltk_enabled = self._setup_nltk()
+        self.nltk_enabled = _setup_nltk()
         self.consensus_threshold = CONSENSUS_SETTINGS["consensus_threshold"]
 
-    def _setup_nltk(self) -> bool:
-        """Set up NLTK resources.
-        
-        Downloads and configures required NLTK components for text analysis:
-        - Creates a dedicated directory for NLTK data in project's data folder
-        - Downloads 'punkt' for sentence tokenization if not present
-        - Downloads 'stopwords' for filtering common words if not present
-        
-        Returns:
-            bool: True if setup successful, False if any errors occurred
-        """
-        try:
-            # Create data directory within project instead of home folder
-            nltk_data_dir = os.path.join(os.path.dirname(__file__), "..", "data", "nltk_data")
-            os.makedirs(nltk_data_dir, exist_ok=True)
-            
-            for resource in ['punkt', 'stopwords']:
-                try:
-                    nltk.data.find(f'tokenizers/{resource}')
-                except LookupError:
-                    nltk.download(resource, quiet=True, download_dir=nltk_data_dir)
-            
-            return True
-        except Exception as e:
-            logger.warning(f"NLTK setup failed: {e}")
-            return False
-
     def _calculate_similarity(self, responses: Dict[str, str]) -> float:
         """Calculate semantic similarity between responses."""
         if not responses:
@@ -114,8 +124,7 @@ class ConsensusEngine:
         """Extract confidence score from response.
         NOTE: Depends on CONFIDENCE section in RESPONSE_FORMAT from round_config.py"""
         try:
-            import re
-            confidence_line = re.search(r"CONFIDENCE:\s*(\d*\.?\d+)", text, re.IGNORECASE)
+            confidence_line = _CONFIDENCE_RE.search(text)
             if confidence_line:
                 confidence = float(confidence_line.group(1))
                 return confidence / 100 if confidence > 1 else confidence
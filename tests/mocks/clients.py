@@ -1,25 +1,56 @@
 """Mock clients for testing."""
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from tests.mocks.responses import get_mock_openai_response, get_mock_anthropic_response
+
+# Built once at import and shared by reference; the payloads are
+# test-read-only, so every client instance can hand out the same object.
+_OPENAI_RESP = get_mock_openai_response()
+_ANTHROPIC_RESP = get_mock_anthropic_response()
+
+class AsyncReturnStub:
+    """Awaitable callable returning a fixed value.
+
+    Records only the last call and a counter — far cheaper than AsyncMock,
+    which builds a child-mock tree and full call history per invocation.
+    """
+    __slots__ = ("return_value", "call_count", "call_args")
+
+    def __init__(self, return_value):
+        self.return_value = return_value
+        self.call_count = 0
+        self.call_args = None
+
+    async def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        self.call_args = (args, kwargs)
+        return self.return_value
+
+class AsyncRaiseStub:
+    """Awaitable callable raising a fixed exception, mirroring AsyncReturnStub."""
+    __slots__ = ("exception", "call_count", "call_args")
+
+    def __init__(self, exception):
+        self.exception = exception
+        self.call_count = 0
+        self.call_args = None
+
+    async def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        self.call_args = (args, kwargs)
+        raise self.exception
 
 class MockAsyncOpenAI:
     """Mock OpenAI client."""
     def __init__(self):
-        self.chat = MagicMock()
-        self.chat.completions = MagicMock()
-        self.chat.completions.create = AsyncMock(return_value=MagicMock(
-            choices=[MagicMock(
-                message=MagicMock(
-                    content="UNDERSTANDING: Test understanding\nCONFIDENCE: 0.9\n"
-                )
-            )]
-        ))
+        self.chat = SimpleNamespace(
+            completions=SimpleNamespace(
+                create=AsyncReturnStub(_OPENAI_RESP)
+            )
+        )
 
 class MockAsyncAnthropic:
     """Mock Anthropic client."""
     def __init__(self):
-        self.messages = MagicMock()
-        self.messages.create = AsyncMock(return_value=MagicMock(
-            content=[MagicMock(
-                text="UNDERSTANDING: Test understanding\nCONFIDENCE: 0.9\n"
-            )]
-        ))
+        self.messages = SimpleNamespace(
+            create=AsyncReturnStub(_ANTHROPIC_RESP)
+        )
@@ -1,16 +1,19 @@
 """Mock database components for testing."""
-from unittest.mock import MagicMock
 from datetime import datetime, UTC
 from typing import List, Dict, Any
-from consensus_engine.database.models import Discussion, DiscussionRound, LLMResponse
+from consensus_engine.database.models import Discussion
+
+# Tests don't depend on real time; a frozen timestamp avoids a
+# clock_gettime syscall per mock object constructed.
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
 
 class MockDiscussion:
     """Mock Discussion model that behaves like SQLAlchemy model."""
     def __init__(self, id: int = None, prompt: str = None, started_at: datetime = None, completed_at: datetime = None):
         self.id = id or 1
         self.prompt = prompt or "Test prompt"
-        self.started_at = started_at or datetime.now(UTC)
-        self.completed_at = completed_at or datetime.now(UTC)
+        self.started_at = started_at or _FIXED_TS
+        self.completed_at = completed_at or _FIXED_TS
         self.consensus_reached = False
         self.consensus = None
         self.rounds = []
@@ -27,7 +30,7 @@ class MockRound:
         self.round_type = ["PRE_FLOP", "FLOP", "TURN", "RIVER", "SHOWDOWN"][round_number]
         self.responses = [MockResponse(**r) for r in (responses or [])]
         self.similarity_score = 1.0
-        self.timestamp = datetime.now(UTC)
+        self.timestamp = _FIXED_TS
 
 class MockResponse:
     """Mock LLMResponse model."""
@@ -35,28 +38,28 @@ class MockResponse:
         self.llm_name = llm_name
         self.response_text = response_text
         self.confidence_score = confidence_score
-        self.timestamp = datetime.now(UTC)
+        self.timestamp = _FIXED_TS
 
 class MockQuery:
-    """Mock query object that maintains state."""
+    """Mock query object.
+
+    filter/order_by results were stored but never applied, so the chain
+    methods now just return self without allocating anything.
+    """
     def __init__(self, session, model=None):
         self.session = session
         self.model = model
-        self._filters = []
-        self._order = None
 
     def filter(self, *args, **kwargs):
-        """Add filters to query."""
-        self._filters.extend(args)
+        """Chain no-op; results are never filtered."""
         return self
 
     def order_by(self, *args):
-        """Add order by clause."""
-        self._order = args
+        """Chain no-op; results are never reordered."""
         return self
 
     def desc(self):
-        """Add descending order."""
+        """Chain no-op."""
         return self
 
     def all(self):
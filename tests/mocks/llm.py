@@ -0,0 +1,54 @@
+"""Canonical mock LLM shared across the test suite.
+
+MockLLM deliberately does not inherit from BaseLLM: the real __init__
+path isn't needed for mocks, and duck typing covers everything the
+engine touches. It is registered as a virtual subclass below so any
+isinstance(llm, BaseLLM) check still passes.
+"""
+from copy import copy
+from functools import lru_cache
+
+from consensus_engine.config.round_config import ROUND_SEQUENCE
+from consensus_engine.models.base import BaseLLM
+from tests.mocks.responses import get_mock_llm_response
+
+class MockLLM:
+    """Mock LLM for testing."""
+    def __init__(self, name: str = "MockLLM", confidence: float = 0.8):
+        self.name = name
+        self.confidence = confidence
+        self.api_key = "mock-key"
+        self.model = "mock-model"
+        self.temperature = 0.7
+        self.max_tokens = 2000
+        self.system_prompt = "mock prompt"
+        self._response_index = 0
+        # One response per round, built up front so generate_response is a
+        # plain list index instead of per-call string formatting.
+        self._responses = [
+            get_mock_llm_response(name, confidence, round_num)
+            for round_num in range(len(ROUND_SEQUENCE))
+        ]
+
+    async def generate_response(self, prompt: str) -> str:
+        response = self._responses[self._response_index]
+        self._response_index = (self._response_index + 1) % len(ROUND_SEQUENCE)
+        return response
+
+BaseLLM.register(MockLLM)
+
+@lru_cache(maxsize=None)
+def _mock_llm_template(name: str, confidence: float) -> MockLLM:
+    """One fully-built template per (name, confidence), kept for the run."""
+    return MockLLM(name, confidence)
+
+def make_mock_llm(name: str = "MockLLM", confidence: float = 0.8) -> MockLLM:
+    """Copy a cached template instead of rebuilding the response list.
+
+    The shallow copy shares the immutable response strings; only the
+    per-instance round index is reset, so each caller still gets an
+    independent stateful mock.
+    """
+    llm = copy(_mock_llm_template(name, confidence))
+    llm._response_index = 0
+    return llm
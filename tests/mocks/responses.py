@@ -1,9 +1,15 @@
 """Mock responses and data for testing."""
 from datetime import datetime, UTC
-from unittest.mock import MagicMock
+from functools import lru_cache
+from types import SimpleNamespace
 
+# Tests don't depend on real time; a frozen timestamp avoids a
+# clock_gettime syscall per payload and keeps the data deterministic.
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
+
+@lru_cache(maxsize=None)
 def get_mock_llm_response(llm_name: str = "TestLLM", confidence: float = 0.8, round_num: int = 0) -> str:
-    """Generate a standardized mock LLM response."""
+    """Generate a standardized mock LLM response, cached per argument tuple."""
     return f"""
 UNDERSTANDING: Test understanding from {llm_name}
 CONSTRAINTS: Test constraints
@@ -11,29 +17,27 @@ INITIAL_POSITION: Test position
 CONFIDENCE: {confidence} Response from {llm_name} in round {round_num}
 """
 
-def get_mock_openai_response() -> MagicMock:
-    """Generate a mock OpenAI API response."""
-    mock_message = MagicMock()
-    mock_message.content = get_mock_llm_response("OpenAI")
-    
-    mock_choice = MagicMock()
-    mock_choice.message = mock_message
-    
-    mock_response = MagicMock()
-    mock_response.choices = [mock_choice]
-    
-    return mock_response
+@lru_cache(maxsize=None)
+def get_mock_openai_response() -> SimpleNamespace:
+    """Generate a mock OpenAI API response.
 
-def get_mock_anthropic_response() -> MagicMock:
+    SimpleNamespace is an order of magnitude cheaper to build than a
+    MagicMock tree, and tests only ever read attributes off the result.
+    """
+    return SimpleNamespace(
+        choices=[SimpleNamespace(
+            message=SimpleNamespace(content=get_mock_llm_response("OpenAI"))
+        )]
+    )
+
+@lru_cache(maxsize=None)
+def get_mock_anthropic_response() -> SimpleNamespace:
     """Generate a mock Anthropic API response."""
-    mock_content = MagicMock()
-    mock_content.text = get_mock_llm_response("Anthropic")
-    
-    mock_response = MagicMock()
-    mock_response.content = [mock_content]
-    
-    return mock_response
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=get_mock_llm_response("Anthropic"))]
+    )
 
+@lru_cache(maxsize=None)
 def get_mock_progress_messages() -> list:
     """Generate mock progress messages."""
     return [
@@ -83,7 +87,7 @@ def get_mock_discussion_data(
         "prompt": prompt,
         "consensus": "Test consensus",
         "consensus_reached": True,
-        "started_at": datetime.now(UTC),
-        "completed_at": datetime.now(UTC),
+        "started_at": _FIXED_TS,
+        "completed_at": _FIXED_TS,
         "rounds": rounds
     }
\ No newline at end of file
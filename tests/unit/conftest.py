@@ -0,0 +1,17 @@
+"""Unit-test fixtures."""
+import pytest
+from tests.conftest import TEST_ENV
+
+@pytest.fixture(scope="package", autouse=True)
+def _fake_api_keys():
+    """Run the unit package with fake API keys in place.
+
+    Set once per package via pytest.MonkeyPatch instead of per test;
+    tests that need missing keys monkeypatch.delenv them explicitly and
+    the function-scoped undo restores these values afterwards.
+    """
+    mp = pytest.MonkeyPatch()
+    for key, value in TEST_ENV.items():
+        mp.setenv(key, value)
+    yield
+    mp.undo()
@@ -1,87 +1,80 @@
 """Tests for CLI interface."""
-import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from types import MappingProxyType
 from consensus_engine.cli import main as cli_main, run_discussion
 
-def test_cli_discussion(cli_runner, mock_engine, mock_db_session):
+# Built once at import and frozen: sharing across tests is safe because
+# nothing can write through the proxy.
+_CLI_RESULT = MappingProxyType({
+    "consensus": "Test consensus",
+    "individual_responses": MappingProxyType({
+        "TestLLM1": "Test response 1",
+        "TestLLM2": "Test response 2"
+    })
+})
+
+async def _mock_run(*args, **kwargs):
+    """Stand-in for run_discussion; always succeeds with the shared result."""
+    return _CLI_RESULT
+
+_TEST_ERROR = "Test error"
+
+async def _mock_run_error(*args, **kwargs):
+    """Stand-in for run_discussion; always fails."""
+    raise Exception(_TEST_ERROR)
+
+def test_cli_discussion(cli_env, cli_runner, monkeypatch):
     """Test running a discussion via CLI."""
     test_prompt = "Test prompt"
-    test_consensus = "Test consensus"
-    test_result = {
-        "consensus": test_consensus,
-        "individual_responses": {
-            "TestLLM1": "Test response 1",
-            "TestLLM2": "Test response 2"
-        }
-    }
-
-    # Create simple sync mock
-    async def mock_run(*args, **kwargs):
-        return test_result
-
-    with patch('consensus_engine.cli.get_db_session', return_value=mock_db_session), \
-         patch('consensus_engine.cli.ConsensusEngine', return_value=mock_engine), \
-         patch('builtins.input', return_value=test_prompt), \
-         patch('consensus_engine.cli.run_discussion', mock_run), \
-         patch.dict('os.environ', {
-             'OPENAI_API_KEY': 'test-key',
-             'ANTHROPIC_API_KEY': 'test-key'
-         }):
-        result = cli_runner.invoke(cli_main, ['--cli'])
-        assert result.exit_code == 0
-        assert test_prompt in result.output
-
-def test_cli_error_handling(cli_runner, mock_engine, mock_db_session):
+
+    monkeypatch.setattr('builtins.input', lambda *args: test_prompt)
+    monkeypatch.setattr('consensus_engine.cli.run_discussion', _mock_run)
+
+    result = cli_runner.invoke(cli_main, ['--cli'])
+    assert result.exit_code == 0
+    assert test_prompt in result.output
+
+def test_cli_error_handling(cli_env, cli_runner, monkeypatch):
     """Test CLI error handling."""
     test_prompt = "Test prompt"
-    test_error = "Test error"
-
-    # Create simple sync mock that raises error
-    def mock_run(*args, **kwargs):
-        raise Exception(test_error)
-
-    with patch('consensus_engine.cli.get_db_session', return_value=mock_db_session), \
-         patch('consensus_engine.cli.ConsensusEngine', return_value=mock_engine), \
-         patch('builtins.input', return_value=test_prompt), \
-         patch('consensus_engine.cli.run_discussion', side_effect=Exception(test_error)), \
-         patch.dict('os.environ', {
-             'OPENAI_API_KEY': 'test-key',
-             'ANTHROPIC_API_KEY': 'test-key'
-         }):
-        result = cli_runner.invoke(cli_main, ['--cli'])
-        print(f"Output: {result.output}")
-        print(f"Exit code: {result.exit_code}")
-        assert result.exit_code == 1
-        assert test_error in str(result.output)
-
-def test_cli_file_input(cli_runner, mock_engine, mock_db_session):
+
+    monkeypatch.setattr('builtins.input', lambda *args: test_prompt)
+    monkeypatch.setattr('consensus_engine.cli.run_discussion', _mock_run_error)
+
+    result = cli_runner.invoke(cli_main, ['--cli'])
+    assert result.exit_code == 1, f"Output: {result.output}"
+    assert _TEST_ERROR in str(result.output)
+
+def test_cli_missing_api_keys(cli_env, cli_runner, monkeypatch):
+    """Test the failure path when no API keys are set."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+    result = cli_runner.invoke(cli_main, ['--cli'])
+    # main() returns 1 here rather than raising, which Click does not
+    # translate into a nonzero exit code, so assert on the message.
+    assert "Missing API keys" in result.output
+    assert "OPENAI_API_KEY" in result.output
+
+async def test_run_discussion_direct(mock_engine, capsys):
+    """Exercise run_discussion without the Click dispatch layer.
+
+    Calling the coroutine the --cli path awaits skips CliRunner's
+    context fork, argument reparse and stream rewiring; the tests above
+    keep covering Click's dispatch end to end.
+    """
+    result = await run_discussion("Test prompt", mock_engine)
+
+    assert result["consensus"] == "Test consensus"
+    output = capsys.readouterr().out
+    assert "Consensus Reached" in output
+    assert "TestLLM1" in output
+
+def test_cli_file_input(cli_env, cli_runner, cli_prompt_file, monkeypatch):
     """Test CLI with file input."""
     test_prompt = "Test prompt from file"
-    test_consensus = "Test consensus"
-    test_result = {
-        "consensus": test_consensus,
-        "individual_responses": {
-            "TestLLM1": "Test response 1",
-            "TestLLM2": "Test response 2"
-        }
-    }
-
-    # Create simple sync mock
-    async def mock_run(*args, **kwargs):
-        return test_result
-
-    with cli_runner.isolated_filesystem(), \
-         patch('consensus_engine.cli.get_db_session', return_value=mock_db_session), \
-         patch('consensus_engine.cli.ConsensusEngine', return_value=mock_engine), \
-         patch('consensus_engine.cli.run_discussion', mock_run), \
-         patch.dict('os.environ', {
-             'OPENAI_API_KEY': 'test-key',
-             'ANTHROPIC_API_KEY': 'test-key'
-         }):
-        # Create test input file
-        with open('test_input.txt', 'w') as f:
-            f.write(test_prompt)
-
-        result = cli_runner.invoke(cli_main, ['--cli', '--file', 'test_input.txt'])
-        assert result.exit_code == 0, f"Got exit code {result.exit_code}, expected 0"
-        assert test_prompt in result.output
\ No newline at end of file
+
+    monkeypatch.setattr('consensus_engine.cli.run_discussion', _mock_run)
+
+    result = cli_runner.invoke(cli_main, ['--cli', '--file', str(cli_prompt_file)])
+    assert result.exit_code == 0, f"Got exit code {result.exit_code}, expected 0"
+    assert test_prompt in result.output
@@ -1,32 +1,25 @@
 """Tests for the consensus engine core functionality."""
 import pytest
 import asyncio
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 from consensus_engine.engine import ConsensusEngine
 from consensus_engine.config.round_config import ROUND_SEQUENCE
-from ..conftest import MockLLM
+from tests.mocks.llm import make_mock_llm
 
-@pytest.mark.asyncio
-async def test_basic_consensus(mock_db_session):
+async def test_basic_consensus(db_session):
     """Test basic consensus achievement."""
     llms = [
-        MockLLM("MockLLM1", confidence=0.9),
-        MockLLM("MockLLM2", confidence=0.9)
+        make_mock_llm("MockLLM1", confidence=0.9),
+        make_mock_llm("MockLLM2", confidence=0.9)
     ]
-    engine = ConsensusEngine(llms, mock_db_session)
+    engine = ConsensusEngine(llms, db_session)
     
     messages = []
     async def progress_callback(msg: str):
         messages.append(msg)
-        print("Progress:", msg)  # Debug print
     
     result = await engine.discuss("test_prompt", progress_callback)
     
-    # Print all messages received
-    print("\nAll messages received:")
-    for msg in messages:
-        print(msg)
-    
     # Verify result structure
     assert isinstance(result, dict)
     
@@ -38,54 +31,44 @@ async def test_basic_consensus(mock_db_session):
     else:
         assert all(llm.name in result for llm in llms)
 
-@pytest.mark.asyncio
-async def test_round_progression(mock_db_session):
+async def test_round_progression(db_session):
     """Test that rounds progress correctly."""
     llms = [
-        MockLLM("MockLLM1", confidence=0.9),
-        MockLLM("MockLLM2", confidence=0.9)
+        make_mock_llm("MockLLM1", confidence=0.9),
+        make_mock_llm("MockLLM2", confidence=0.9)
     ]
-    engine = ConsensusEngine(llms, mock_db_session)
+    engine = ConsensusEngine(llms, db_session)
     
     messages = []
     async def progress_callback(msg: str):
         messages.append(msg)
-        print("Progress:", msg)  # Debug print
     
     await engine.discuss("test_prompt", progress_callback)
     
-    # Print all messages for debugging
-    print("\nAll messages received:")
-    for msg in messages:
-        print(msg)
-    
     # Check each round type
     for round_type in ROUND_SEQUENCE:
         found = any(f"Starting {round_type}" in msg for msg in messages)
         assert found, f"Round {round_type} not found in messages"
 
-@pytest.mark.asyncio
-async def test_error_handling(mock_db_session):
+async def test_error_handling(db_session):
     """Test error handling during discussion."""
-    working_llm = MockLLM("WorkingLLM", confidence=0.9)
+    working_llm = make_mock_llm("WorkingLLM", confidence=0.9)
+
+    async def _raise(*args, **kwargs):
+        raise Exception("Test error")
+
     failing_llm = MagicMock()
     failing_llm.name = "FailingLLM"
-    failing_llm.generate_response = AsyncMock(side_effect=Exception("Test error"))
+    failing_llm.generate_response = _raise
     
-    engine = ConsensusEngine([working_llm, failing_llm], mock_db_session)
+    engine = ConsensusEngine([working_llm, failing_llm], db_session)
     
     messages = []
     async def progress_callback(msg: str):
         messages.append(msg)
-        print("Progress:", msg)  # Debug print
     
     result = await engine.discuss("test_prompt", progress_callback)
     
-    # Print all messages for debugging
-    print("\nAll messages received:")
-    for msg in messages:
-        print(msg)
-    
     # Check error was handled and working LLM continued
     assert isinstance(result, dict)
     assert any("error" in msg.lower() for msg in messages)
@@ -100,26 +83,19 @@ async def test_error_handling(mock_db_session):
         assert "WorkingLLM" in result
         assert "FailingLLM" not in result
 
-@pytest.mark.asyncio
-async def test_consensus_threshold(mock_db_session):
+async def test_consensus_threshold(db_session):
     """Test consensus threshold behavior."""
-    high_conf_llm = MockLLM("HighConfLLM", confidence=0.9)
-    low_conf_llm = MockLLM("LowConfLLM", confidence=0.4)
+    high_conf_llm = make_mock_llm("HighConfLLM", confidence=0.9)
+    low_conf_llm = make_mock_llm("LowConfLLM", confidence=0.4)
     
-    engine = ConsensusEngine([high_conf_llm, low_conf_llm], mock_db_session)
+    engine = ConsensusEngine([high_conf_llm, low_conf_llm], db_session)
     
     messages = []
     async def progress_callback(msg: str):
         messages.append(msg)
-        print("Progress:", msg)  # Debug print
     
     result = await engine.discuss("test_prompt", progress_callback)
     
-    # Print all messages for debugging
-    print("\nAll messages received:")
-    for msg in messages:
-        print(msg)
-    
     # Verify either consensus or individual responses
     assert isinstance(result, dict)
     if "consensus" in result:
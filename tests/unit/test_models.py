@@ -1,88 +1,81 @@
 """Tests for LLM model implementations."""
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-from openai import AsyncOpenAI
-from anthropic import AsyncAnthropic
 from consensus_engine.models.openai import OpenAILLM
 from consensus_engine.models.anthropic import AnthropicLLM
-from consensus_engine.config.settings import MODEL_CONFIGS
-from tests.mocks.clients import MockAsyncOpenAI, MockAsyncAnthropic
-from tests.mocks.responses import (
-    get_mock_llm_response,
-    get_mock_openai_response,
-    get_mock_anthropic_response
+from tests.mocks.clients import AsyncRaiseStub, MockAsyncOpenAI, MockAsyncAnthropic
+
+def _openai_create(client):
+    return client.chat.completions.create
+
+def _anthropic_create(client):
+    return client.messages.create
+
+def _openai_uses_system_prompt(kwargs):
+    return any(msg['role'] == 'system' for msg in kwargs['messages'])
+
+def _anthropic_uses_system_prompt(kwargs):
+    return 'system' in kwargs
+
+def _set_openai_create(client, stub):
+    client.chat.completions.create = stub
+
+def _set_anthropic_create(client, stub):
+    client.messages.create = stub
+
+# The vendors differ only in client shape and how the system prompt is
+# passed; everything else is exercised by one parametrized body.
+VENDORS = [
+    pytest.param(
+        OpenAILLM, MockAsyncOpenAI, _openai_create, _set_openai_create,
+        _openai_uses_system_prompt, id="openai"
+    ),
+    pytest.param(
+        AnthropicLLM, MockAsyncAnthropic, _anthropic_create, _set_anthropic_create,
+        _anthropic_uses_system_prompt, id="anthropic"
+    ),
+]
+
+@pytest.mark.parametrize(
+    "llm_cls, expected_name",
+    [(OpenAILLM, "OpenAI"), (AnthropicLLM, "Anthropic")],
+    ids=["openai", "anthropic"]
 )
+def test_name_property(llm_cls, expected_name):
+    """Test the provider name property."""
+    # Any injected object skips SDK client construction entirely.
+    llm = llm_cls("test-key", client=object())
+    assert llm.name == expected_name
 
-@pytest.mark.asyncio
-async def test_openai_response_format():
-    """Test OpenAI response formatting."""
-    llm = OpenAILLM("test-key")
-    llm.client = MockAsyncOpenAI()
-    
-    response = await llm.generate_response("test prompt")
-    assert isinstance(response, str)
-    assert "UNDERSTANDING:" in response
-    assert "CONFIDENCE:" in response
+@pytest.mark.parametrize("llm_cls, client_cls, get_create, set_create, uses_system_prompt", VENDORS)
+async def test_response_format(llm_cls, client_cls, get_create, set_create, uses_system_prompt):
+    """Test response formatting."""
+    llm = llm_cls("test-key", client=client_cls())
 
-@pytest.mark.asyncio
-async def test_anthropic_response_format():
-    """Test Anthropic response formatting."""
-    llm = AnthropicLLM("test-key")
-    llm.client = MockAsyncAnthropic()
-    
     response = await llm.generate_response("test prompt")
     assert isinstance(response, str)
     assert "UNDERSTANDING:" in response
     assert "CONFIDENCE:" in response
 
-@pytest.mark.asyncio
-async def test_openai_error_handling():
-    """Test OpenAI error handling."""
-    mock_client = MockAsyncOpenAI()
-    mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
-    
-    llm = OpenAILLM("test-key")
-    llm.client = mock_client
-    
-    with pytest.raises(Exception):
-        await llm.generate_response("test prompt")
+@pytest.mark.parametrize("llm_cls, client_cls, get_create, set_create, uses_system_prompt", VENDORS)
+async def test_error_handling(llm_cls, client_cls, get_create, set_create, uses_system_prompt):
+    """Test error handling."""
+    mock_client = client_cls()
+    set_create(mock_client, AsyncRaiseStub(Exception("API Error")))
+
+    llm = llm_cls("test-key", client=mock_client)
 
-@pytest.mark.asyncio
-async def test_anthropic_error_handling():
-    """Test Anthropic error handling."""
-    mock_client = MockAsyncAnthropic()
-    mock_client.messages.create = AsyncMock(side_effect=Exception("API Error"))
-    
-    llm = AnthropicLLM("test-key")
-    llm.client = mock_client
-    
     with pytest.raises(Exception):
         await llm.generate_response("test prompt")
 
-@pytest.mark.asyncio
-async def test_openai_system_prompt():
-    """Test OpenAI system prompt usage."""
-    mock_client = MockAsyncOpenAI()
-    
-    llm = OpenAILLM("test-key")
-    llm.client = mock_client
-    
-    await llm.generate_response("test prompt")
-    
-    # Check if system message was included
-    messages = mock_client.chat.completions.create.call_args[1]['messages']
-    assert any(msg['role'] == 'system' for msg in messages)
-
-@pytest.mark.asyncio
-async def test_anthropic_system_prompt():
-    """Test Anthropic system prompt usage."""
-    mock_client = MockAsyncAnthropic()
-    
-    llm = AnthropicLLM("test-key")
-    llm.client = mock_client
-    
+@pytest.mark.parametrize("llm_cls, client_cls, get_create, set_create, uses_system_prompt", VENDORS)
+async def test_system_prompt(llm_cls, client_cls, get_create, set_create, uses_system_prompt):
+    """Test system prompt usage."""
+    mock_client = client_cls()
+
+    llm = llm_cls("test-key", client=mock_client)
+
     await llm.generate_response("test prompt")
-    
-    # Check if system message was included
-    call_args = mock_client.messages.create.call_args[1]
-    assert 'system' in call_args
\ No newline at end of file
+
+    # Check if the system prompt was included in the request
+    call_kwargs = get_create(mock_client).call_args[1]
+    assert uses_system_prompt(call_kwargs)